@@ -0,0 +1,61 @@
+"""Added trigram search indexes
+
+Revision ID: 3f9d2c8e1a47
+Revises: 6af1b084a1f0
+Create Date: 2026-10-16 20:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel  # NEW
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9d2c8e1a47"
+down_revision: Union[str, None] = "6af1b084a1f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_user_username_trgm",
+        "user",
+        ["username"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"username": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_user_username_lower",
+        "user",
+        [sa.text("lower(username) text_pattern_ops")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_profile_short_intro_trgm",
+        "profile",
+        ["short_intro"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"short_intro": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_profile_location_trgm",
+        "profile",
+        ["location"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"location": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_profile_location_trgm", table_name="profile")
+    op.drop_index("ix_profile_short_intro_trgm", table_name="profile")
+    op.drop_index("ix_user_username_lower", table_name="user")
+    op.drop_index("ix_user_username_trgm", table_name="user")
+    # pg_trgm is left installed; other objects may depend on it
@@ -0,0 +1,29 @@
+"""Added profile keyset pagination index
+
+Revision ID: 8c41e7b2d5f0
+Revises: 3f9d2c8e1a47
+Create Date: 2026-10-16 21:05:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel  # NEW
+
+# revision identifiers, used by Alembic.
+revision: str = "8c41e7b2d5f0"
+down_revision: Union[str, None] = "3f9d2c8e1a47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_profile_created_at_id", "profile", ["created_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_profile_created_at_id", table_name="profile")
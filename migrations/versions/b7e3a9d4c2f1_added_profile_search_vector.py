@@ -0,0 +1,67 @@
+"""Added profile search_vector
+
+Revision ID: b7e3a9d4c2f1
+Revises: 8c41e7b2d5f0
+Create Date: 2026-10-16 21:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel  # NEW
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e3a9d4c2f1"
+down_revision: Union[str, None] = "8c41e7b2d5f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "profile",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('english', "
+                "coalesce(short_intro, '') || ' ' || coalesce(location, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_profile_search_vector",
+        "profile",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    # Intro and location are now searched through search_vector
+    op.drop_index("ix_profile_location_trgm", table_name="profile")
+    op.drop_index("ix_profile_short_intro_trgm", table_name="profile")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_profile_short_intro_trgm",
+        "profile",
+        ["short_intro"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"short_intro": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_profile_location_trgm",
+        "profile",
+        ["location"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"location": "gin_trgm_ops"},
+    )
+    op.drop_index("ix_profile_search_vector", table_name="profile")
+    op.drop_column("profile", "search_vector")
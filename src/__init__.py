@@ -1,4 +1,4 @@
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 import jinja2
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
@@ -42,6 +42,7 @@ app = FastAPI(
     version=version,
     docs_url=f"/api/{version}/docs",
     redoc_url=f"/api/{version}/redoc",
+    default_response_class=ORJSONResponse,
     contact={
         "name": "Devsearch admin",
         "email": "devsearch@gmail.com",
@@ -17,6 +17,7 @@ from src.db.models import Otp, Profile, User
 from src.db.redis import (
     add_jti_to_user_sessions,
     delete_all_user_sessions,
+    invalidate_profile_counts,
     is_jti_in_user_sessions,
     remove_jti_from_user_sessions,
 )
@@ -79,6 +80,7 @@ class UserService:
         session.add(profile)
         await session.commit()
         await session.refresh(profile)
+        await invalidate_profile_counts()
 
         return new_user
 
@@ -99,6 +101,7 @@ class UserService:
         session.add(profile)
         await session.commit()
         await session.refresh(profile)
+        await invalidate_profile_counts()
 
         return new_user
 
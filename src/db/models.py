@@ -3,7 +3,19 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from pydantic import EmailStr, model_validator
-from sqlalchemy import DateTime, Integer, String, UniqueConstraint, func
+from sqlalchemy import (
+    DDL,
+    Computed,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    column,
+    event,
+    func,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import Column, Field, Relationship, SQLModel
 
 from src.config import Config
@@ -14,7 +26,31 @@ def get_utc_now():
     return datetime.now(timezone.utc)
 
 
+# gin_trgm_ops comes from pg_trgm, so it must exist before create_all builds indexes
+event.listen(
+    SQLModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 class User(SQLModel, table=True):
+    __table_args__ = (
+        # Trigram index so the profile search's ILIKE '%term%' can skip a seq scan
+        Index(
+            "ix_user_username_trgm",
+            "username",
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+        ),
+        # Case-insensitive exact and prefix lookups on lower(username)
+        Index(
+            "ix_user_username_lower",
+            func.lower(column("username")).label("username_lower"),
+            postgresql_ops={"username_lower": "text_pattern_ops"},
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     first_name: str = Field(max_length=50, min_length=1)
     last_name: str = Field(max_length=50, min_length=1)
@@ -142,6 +178,12 @@ class ProfileSkill(SQLModel, table=True):
 
 
 class Profile(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_profile_search_vector", "search_vector", postgresql_using="gin"),
+        # Matches the newest-first keyset ordering of the profile list
+        Index("ix_profile_created_at_id", "created_at", "id"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: uuid.UUID | None = Field(
         default=None, foreign_key="user.id", unique=True, ondelete="CASCADE"
@@ -150,6 +192,19 @@ class Profile(SQLModel, table=True):
     short_intro: str | None = Field(default=None, max_length=200)
     bio: str | None = None
     location: str | None = Field(default=None, max_length=100)
+    # Kept in sync by Postgres; username lives on User so it is searched separately
+    search_vector: str | None = Field(
+        default=None,
+        exclude=True,
+        sa_column=Column(
+            TSVECTOR,
+            Computed(
+                "to_tsvector('english', "
+                "coalesce(short_intro, '') || ' ' || coalesce(location, ''))",
+                persisted=True,
+            ),
+        ),
+    )
     # "https://res.cloudinary.com/dq0ow9lxw/image/upload/v1732236186/default-image_foxagq.jpg", - more useful in Django MVT
     avatar_url: str | None = Field(
         default=None,
@@ -1,8 +1,15 @@
+import logging
+
 from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 
 from src.config import Config
 
 token_blocklist = aioredis.from_url(Config.REDIS_URL)
+count_cache = aioredis.from_url(Config.REDIS_URL)
+
+# Cached profile list counts live under count:profiles:<generation>:<search>
+PROFILE_COUNT_PREFIX = "profiles:"
 
 
 async def add_jti_to_user_sessions(user_id: str, jti: str, expiry_seconds: int) -> None:
@@ -34,3 +41,61 @@ async def get_user_session_count(user_id: str) -> int:
     """Get count of active sessions for a user"""
     key = f"user_sessions:{user_id}"
     return await token_blocklist.scard(key)
+
+
+async def count_cache_key(prefix: str, key: str) -> str | None:
+    """
+    Build the cache key for a count under the prefix's current generation.
+
+    Returns None when Redis is unavailable, which callers treat as a miss.
+    """
+    try:
+        generation = await count_cache.get(f"count:{prefix}gen")
+    except RedisError:
+        logging.warning(f"Could not read count generation {prefix}", exc_info=True)
+        return None
+    return f"count:{prefix}{int(generation or 0)}:{key}"
+
+
+async def get_cached_count(key: str | None) -> int | None:
+    """
+    Get a cached row count, or None if it has expired.
+
+    Redis errors are logged and treated as a miss, so callers fall back to
+    running the COUNT(*) themselves.
+    """
+    if key is None:
+        return None
+    try:
+        count = await count_cache.get(key)
+    except RedisError:
+        logging.warning(f"Could not read cached count {key}", exc_info=True)
+        return None
+    return int(count) if count is not None else None
+
+
+async def cache_count(key: str | None, count: int, expiry_seconds: int = 60) -> None:
+    """Cache a row count so list endpoints can skip COUNT(*) for a while"""
+    if key is None:
+        return
+    try:
+        await count_cache.set(key, count, ex=expiry_seconds)
+    except RedisError:
+        logging.warning(f"Could not cache count {key}", exc_info=True)
+
+
+async def invalidate_counts(prefix: str) -> None:
+    """
+    Retire every cached count under the prefix by bumping its generation.
+
+    Keys from older generations are never read again and expire on their TTL.
+    """
+    try:
+        await count_cache.incr(f"count:{prefix}gen")
+    except RedisError:
+        logging.warning(f"Could not invalidate counts {prefix}", exc_info=True)
+
+
+async def invalidate_profile_counts() -> None:
+    """Drop the cached profile list counts after profiles are added or edited"""
+    await invalidate_counts(PROFILE_COUNT_PREFIX)
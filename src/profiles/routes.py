@@ -1,3 +1,4 @@
+from typing import Annotated
 from urllib.parse import urlencode
 from uuid import UUID
 
@@ -27,6 +28,7 @@ from src.profiles.schemas import (
     AvatarUploadResponse,
     PaginationData,
     ProfileData,
+    ProfileListParams,
     ProfileListResponse,
     ProfileListResult,
     ProfileResponse,
@@ -39,6 +41,7 @@ from src.profiles.schemas import (
     SkillUpdate,
 )
 from src.profiles.service import ProfileService
+from src.profiles.utils import decode_cursor, encode_cursor
 
 router = APIRouter()
 
@@ -77,9 +80,7 @@ def profile_response(message, profile_with_user, skills_response):
 )
 async def get_profiles(
     request: Request,
-    search: str = Query(None, description="Search by username, intro, or location"),
-    limit: int = Query(20, ge=1, le=100, description="Number of profiles to return"),
-    offset: int = Query(0, ge=0, description="Number of profiles to skip"),
+    params: Annotated[ProfileListParams, Query()],
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -87,35 +88,53 @@ async def get_profiles(
 
     EXAMPLE:
     - GET /profiles/ → Returns first 20 profiles
-    - GET /profiles/?search=python → Returns profiles mentioning "python"
+    - GET /profiles/?search=python → Returns profiles whose username contains
+      "python", or whose intro or location contain the word "python"
     - GET /profiles/?limit=10&offset=20 → Returns profiles 21-30
+    - GET /profiles/?limit=10&cursor=... → Returns the 10 profiles after the cursor
+
+    Search matches usernames by case-insensitive substring. Intro and location
+    are matched by full-text search on whole, stemmed English words, so
+    "developers" finds "developer" but "pyth" does not find "python".
+
+    The next link always carries a cursor; offset is kept for existing clients.
     """
-    profiles, total_count = await profile_service.get_all_profiles(
-        session=session, search=search, limit=limit, offset=offset
+    decoded_cursor = None
+    if params.cursor:
+        try:
+            decoded_cursor = decode_cursor(params.cursor)
+        except ValueError as exc:
+            raise UnprocessableEntity("Invalid pagination cursor") from exc
+
+    profiles, total_count, next_cursor = await profile_service.get_all_profiles(
+        session=session,
+        search=params.search,
+        limit=params.limit,
+        offset=params.offset,
+        cursor=decoded_cursor,
     )
 
     # Build pagination URLs
     base_url = str(request.url).split("?")[0]
     query_params = {}
 
-    if search:
-        query_params["search"] = search
+    if params.search:
+        query_params["search"] = params.search
 
     # Next page URL
-    next_offset = offset + limit
-    if next_offset < total_count:
+    if next_cursor:
         next_params = query_params.copy()
-        next_params["limit"] = limit
-        next_params["offset"] = next_offset
+        next_params["limit"] = params.limit
+        next_params["cursor"] = encode_cursor(*next_cursor)
         next_url = f"{base_url}?{urlencode(next_params)}"
     else:
         next_url = None
 
-    # Previous page URL
-    previous_offset = offset - limit
-    if offset > 0:
+    # Previous page URL (cursor pages only walk forward)
+    previous_offset = params.offset - params.limit
+    if params.offset > 0 and not params.cursor:
         previous_params = query_params.copy()
-        previous_params["limit"] = limit
+        previous_params["limit"] = params.limit
         previous_params["offset"] = max(0, previous_offset)
         previous_url = f"{base_url}?{urlencode(previous_params)}"
     else:
@@ -37,7 +37,7 @@ PROFILE_RES_EX = {
 
 PROFILES = {
     "count": 150,
-    "next": "http://localhost:8000/profiles/?limit=20&offset=20",
+    "next": "http://localhost:8000/profiles/?limit=20&cursor=MjAyNC0xMS0yMlQxMDozMDowMCswMDowMHwzZmE4NWY2NC01NzE3LTQ1NjItYjNmYy0yYzk2M2Y2NmFmYTY=",
     "previous": "null",
     "results": [
         {
@@ -108,6 +108,20 @@ class ProfileListResult(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PaginationParams(BaseModel):
+    limit: int = Field(20, ge=1, le=100, description="Number of profiles to return")
+    offset: int = Field(0, ge=0, description="Number of profiles to skip")
+
+
+class ProfileListParams(PaginationParams):
+    search: str | None = Field(
+        None, description="Username substring, or whole words in intro or location"
+    )
+    cursor: str | None = Field(
+        None, description="Opaque cursor taken from a previous page's next link"
+    )
+
+
 class PaginationData(BaseModel):
     count: int
     next: str | None = None
@@ -1,11 +1,21 @@
+import uuid
+from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import func
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import contains_eager, joinedload, selectinload
 from sqlmodel import or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.cloudinary_service import CloudinaryService
 from src.db.models import Profile, ProfileSkill, Skill, User
+from src.db.redis import (
+    PROFILE_COUNT_PREFIX,
+    cache_count,
+    count_cache_key,
+    get_cached_count,
+    invalidate_profile_counts,
+)
 
 
 class ProfileService:
@@ -15,9 +25,21 @@ class ProfileService:
         search: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,  # e.g if 20, skip first 20
-    ) -> List[Profile]:
+        cursor: Optional[tuple[datetime, uuid.UUID]] = None,
+    ) -> tuple[List[Profile], int, Optional[tuple[datetime, uuid.UUID]]]:
         """
-        Get list of all profiles with optional search
+        Get list of all profiles with optional search, newest first
+
+        A cursor is the (created_at, id) of the last profile already seen and
+        takes precedence over offset, so deep pages are an index seek rather
+        than a scan past every skipped row.
+
+        The total count is cached in Redis for up to 60s per search term and
+        dropped whenever a profile is created or edited. If Redis is
+        unavailable the count is computed every time.
+
+        Returns the page, the total count and the cursor for the next page
+        (None on the last page).
         """
         statement = select(Profile).join(User)
 
@@ -26,20 +48,46 @@ class ProfileService:
             statement = statement.where(
                 or_(
                     User.username.ilike(pattern),  # Search username
-                    Profile.short_intro.ilike(pattern),  # Search intro
-                    Profile.location.ilike(pattern),  # Search location
+                    # Search intro and location through the GIN-indexed tsvector
+                    Profile.search_vector.op("@@")(
+                        func.plainto_tsquery("english", search)
+                    ),
                 )
             )
 
-        # Get total count (without limit/offset)
-        count_query = select(func.count()).select_from(statement.subquery())
-        count_result = await session.exec(count_query)
-        total_count = count_result.one()
+        # Get total count (without limit/offset), cached briefly per search term
+        count_key = await count_cache_key(
+            PROFILE_COUNT_PREFIX, (search or "").lower()
+        )
+        total_count = await get_cached_count(count_key)
+        if total_count is None:
+            count_query = select(func.count()).select_from(statement.subquery())
+            count_result = await session.exec(count_query)
+            total_count = count_result.one()
+            await cache_count(count_key, total_count)
+
+        # Fill profile.user from the join; the results are read outside this
+        # session's async context, where a lazy load would fail
+        statement = statement.options(contains_eager(Profile.user)).order_by(
+            Profile.created_at.desc(), Profile.id.desc()
+        )
+        if cursor:
+            statement = statement.where(
+                tuple_(Profile.created_at, Profile.id) < tuple_(*cursor)
+            )
+        else:
+            statement = statement.offset(offset)
+
+        # Fetch one extra row to tell whether another page exists
+        result = await session.exec(statement.limit(limit + 1))
+        profiles = result.all()
 
-        statement = statement.offset(offset).limit(limit)
+        next_cursor = None
+        if len(profiles) > limit:
+            profiles = profiles[:limit]
+            next_cursor = (profiles[-1].created_at, profiles[-1].id)
 
-        result = await session.exec(statement)
-        return result.all(), total_count
+        return profiles, total_count, next_cursor
 
     async def get_profile_by_username(
         self, username: str, session: AsyncSession
@@ -47,8 +95,10 @@ class ProfileService:
         """
         Get a profile by username
         """
-        # user_statement = select(User).where(User.username == username.lower())
-        user_statement = select(User).where(User.username.ilike(username))
+        # Uses ix_user_username_lower; ILIKE would also treat _ and % as wildcards
+        user_statement = select(User).where(
+            func.lower(User.username) == username.lower()
+        )
 
         user_result = await session.exec(user_statement)
         user = user_result.first()
@@ -77,6 +127,8 @@ class ProfileService:
         session.add(profile)
         await session.commit()
         await session.refresh(profile)
+        # Intro and location feed search, so cached search counts may change
+        await invalidate_profile_counts()
         return profile
 
     async def update_avatar(
@@ -183,7 +235,11 @@ class ProfileService:
         self, profile_id: str, session: AsyncSession
     ) -> List[ProfileSkill]:
         """Get all skills for a profile"""
-        statement = select(ProfileSkill).where(ProfileSkill.profile_id == profile_id)
+        statement = (
+            select(ProfileSkill)
+            .options(selectinload(ProfileSkill.skill))
+            .where(ProfileSkill.profile_id == profile_id)
+        )
         result = await session.exec(statement)
         return result.all()
 
@@ -213,8 +269,16 @@ class ProfileService:
 
         session.add(profile_skill)
         await session.commit()
-        await session.refresh(profile_skill)
-        return profile_skill
+
+        # Reload the row and its (possibly new) skill in a single query
+        statement = (
+            select(ProfileSkill)
+            .options(joinedload(ProfileSkill.skill))
+            .where(ProfileSkill.id == profile_skill.id)
+            .execution_options(populate_existing=True)
+        )
+        result = await session.exec(statement)
+        return result.one()
 
     async def delete_profile_skill(
         self, profile_skill: ProfileSkill, session: AsyncSession
@@ -0,0 +1,25 @@
+import base64
+import uuid
+from datetime import datetime
+
+
+def encode_cursor(created_at: datetime, profile_id: uuid.UUID) -> str:
+    """Encode the last-seen (created_at, id) pair as an opaque page cursor"""
+    raw = f"{created_at.isoformat()}|{profile_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed or its timestamp is naive
+    """
+    raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    created_at, profile_id = raw.split("|")
+    created_at = datetime.fromisoformat(created_at)
+    # created_at is timestamptz; a naive value can't be compared with it
+    if created_at.tzinfo is None:
+        raise ValueError("Cursor timestamp has no timezone")
+    return created_at, uuid.UUID(profile_id)
@@ -1,6 +1,7 @@
 from typing import List, Optional
 
 from slugify import slugify
+from sqlalchemy import inspect
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from sqlmodel import col, func, or_, select
@@ -41,8 +42,8 @@ class ProjectService:
                 or_(Project.title.ilike(pattern), Project.description.ilike(pattern))
             )
 
-        # Order by popularity
-        statement = statement.order_by(col(Project.vote_total).desc())
+        # Order by popularity; id breaks ties so offset pages don't overlap
+        statement = statement.order_by(col(Project.vote_total).desc(), col(Project.id))
 
         statement = statement.offset(offset).limit(limit)
 
@@ -102,6 +103,11 @@ class ProjectService:
 
         if new_project.owner:
             await session.refresh(new_project.owner, attribute_names=["user"])
+            # A slug-conflict rollback expires everything already in the session,
+            # and the refresh above hands back that expired User as-is
+            owner_user = new_project.owner.user
+            if owner_user and inspect(owner_user).expired:
+                await session.refresh(owner_user)
 
         return new_project
 
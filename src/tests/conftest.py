@@ -1,14 +1,16 @@
-import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import AsyncGenerator
+from functools import lru_cache
+from typing import AsyncGenerator, Iterator
+from unittest.mock import AsyncMock, Mock
 
+import bcrypt
 import jwt
 import pytest
+import uvloop
 from fakeredis import FakeAsyncRedis
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import selectinload
-from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -16,9 +18,90 @@ from src import app
 from src.auth.schemas import UserCreate
 from src.config import Config
 from src.db.main import get_session
-from src.db.models import Profile, ProfileSkill, Project, Review, Skill, Tag
+from src.db.models import Profile, ProfileSkill, Project, Review, Skill, Tag, User
 from src.profiles.service import ProfileService
 from src.projects.service import ProjectService
+from src.tests.utils import auth_header, fixture_user_id
+
+
+@lru_cache
+def hash_test_password(password: str) -> str:
+    """
+    Hashes a test password once, at bcrypt's minimum cost.
+
+    verify_password accepts any cost, so logging in with the plain password
+    still works; tests just skip paying full bcrypt cost per user fixture.
+    """
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=4)).decode()
+
+
+def build_test_user(user_data: dict, **fields) -> User:
+    """
+    Builds an unsaved user and profile using the cached password hash.
+
+    The id is derived from the username, so the same fixture user keeps
+    one id (and one cached access token) across tests. The profile is
+    attached through the relationship, so user.profile is loaded without
+    another query once the user is committed.
+
+    Args:
+        user_data: Registration data, as in user3_data
+        **fields: Extra User fields, e.g. is_email_verified=True
+
+    Returns:
+        User: The pending user, with its profile
+    """
+    user = User.model_validate(
+        UserCreate(**user_data),
+        update={
+            "id": fixture_user_id(user_data["username"]),
+            "hashed_password": hash_test_password(user_data["password"]),
+            **fields,
+        },
+    )
+    user.profile = Profile()
+
+    return user
+
+
+async def create_test_user(session: AsyncSession, user_data: dict, **fields) -> User:
+    """
+    Inserts a user and their profile.
+
+    Server defaults such as created_at come back from the INSERT's
+    RETURNING clause.
+
+    Args:
+        session: Database session
+        user_data: Registration data, as in user3_data
+        **fields: Extra User fields, e.g. is_email_verified=True
+
+    Returns:
+        User: The committed user, with its profile
+    """
+    user = build_test_user(user_data, **fields)
+    session.add(user)
+    await session.commit()
+
+    return user
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """
+    Lowers the app's bcrypt cost to the minimum for the test session.
+
+    Endpoints such as register and password reset hash through pwd_context;
+    at the default cost each call takes a noticeable fraction of a second.
+    """
+    from src.auth.utils import pwd_context
+
+    original_config = pwd_context.to_dict()
+    pwd_context.update(bcrypt__rounds=4)
+
+    yield
+
+    pwd_context.load(original_config)
 
 
 @pytest.fixture(scope="session")
@@ -37,10 +120,11 @@ async def mock_redis(monkeypatch, redis_client):
     Automatically mocks Redis for all tests.
     autouse=True means this runs for every test without needing to specify it.
     """
-    # Mock the token_blocklist that's created at module level
+    # Mock the clients that are created at module level
     from src.db import redis
 
     monkeypatch.setattr(redis, "token_blocklist", redis_client)
+    monkeypatch.setattr(redis, "count_cache", redis_client)
 
     yield
 
@@ -48,51 +132,12 @@ async def mock_redis(monkeypatch, redis_client):
     await redis_client.flushall()
 
 
-# Create async engine
-engine = create_async_engine(
-    Config.DATABASE_URL,
-    echo=False,  # Set to True to see SQL queries in development
-    future=True,
-)
-
-# Create async session maker
-SessionLocal = async_sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
-
-
-async def get_db():
-    """
-    Dependency function that yields database sessions.
-    """
-    async with SessionLocal() as session:
-        yield session
-
-
 @pytest.fixture(scope="session")
-def event_loop():
+def event_loop_policy():
     """
-    Creates an event loop for the entire test session.
+    Runs the session event loop on uvloop instead of the default asyncio loop.
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
-@pytest.fixture(scope="session")
-def postgresql_proc_config():
-    """
-    Configure how pytest-postgresql starts the PostgreSQL process.
-    """
-    return {
-        "port": None,  # Random port
-        "host": "localhost",
-        "user": "postgres",
-        "password": "",
-        "options": "-c fsync=off",  # Faster for testing
-    }
+    return uvloop.EventLoopPolicy()
 
 
 @pytest.fixture(scope="session")
@@ -106,6 +151,8 @@ async def database_url(postgresql_proc):
     user = postgresql_proc.user
     host = postgresql_proc.host
     port = postgresql_proc.port
+    # Under pytest-xdist each worker is its own process and starts its own
+    # postgresql_proc cluster on a random port, so workers never share rows
     dbname = postgresql_proc.dbname
     password = postgresql_proc.password if hasattr(postgresql_proc, "password") else ""
 
@@ -120,11 +167,11 @@ async def database_url(postgresql_proc):
     if not database_exists(sync_url):
         create_database(sync_url)
 
-    # Construct and return async URL for the engine (using psycopg instead of asyncpg)
+    # Construct and return async URL for the engine (asyncpg, as in production)
     async_url = (
-        f"postgresql+psycopg://{user}:{password}@{host}:{port}/{dbname}"
+        f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{dbname}"
         if password
-        else f"postgresql+psycopg://{user}@{host}:{port}/{dbname}"
+        else f"postgresql+asyncpg://{user}@{host}:{port}/{dbname}"
     )
 
     return async_url
@@ -134,6 +181,7 @@ async def database_url(postgresql_proc):
 async def test_engine(database_url):
     """
     Creates async SQLAlchemy engine connected to temporary database.
+    The schema is created once here instead of before every test.
 
     Args:
         database_url: URL from database_url fixture
@@ -144,11 +192,17 @@ async def test_engine(database_url):
     # Create async engine
     engine = create_async_engine(
         database_url,
-        echo=False,  # Set to True to see SQL queries
-        poolclass=NullPool,  # Don't pool connections in tests
+        echo=False,  # Set to True to see SQL queries (useful for debugging)
+        # Every test checks out a connection; keep them open on the session loop
+        pool_size=10,
+        max_overflow=0,
         future=True,
     )
 
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
     yield engine
 
     # Dispose engine
@@ -156,133 +210,114 @@ async def test_engine(database_url):
 
 
 @pytest.fixture
-async def database(test_engine) -> AsyncGenerator[AsyncSession, None]:
+async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
     """
-    Creates a fresh database with clean tables for each test.
+    Creates a database session whose changes are rolled back after each test.
+
+    The session joins an outer transaction on a dedicated connection, so
+    commits made by fixtures or the app only release a SAVEPOINT and the
+    final rollback leaves the tables as they were before the test.
+
+    The app is handed this same session (see override_get_session), so a
+    flush is enough for a request to see rows a test has just added. Use a
+    commit when the data must survive an app-side rollback.
     """
-    # Drop and recreate all tables before each test
-    async with test_engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
-        await conn.run_sync(SQLModel.metadata.create_all)
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
 
-    # Create session
-    async_session_maker = async_sessionmaker(
-        bind=test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
 
-    async with async_session_maker() as session:
         try:
             yield session
         finally:
             await session.close()
+            await transaction.rollback()
 
 
-@pytest.fixture
-async def client(database: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+@pytest.fixture(scope="session")
+async def test_app():
     """
-    Creates an async HTTP client for testing API endpoints.
+    Runs the app's lifespan once for the whole session.
 
-    Args:
-        database: Database session from database fixture
-
-    Yields:
-        AsyncClient: HTTP client for making requests
+    ASGITransport never sends lifespan events, so startup and shutdown
+    handlers only run here, on the session event loop.
     """
-
-    # Override the database dependency
-    async def override_get_db():
-        yield database
-
-    app.dependency_overrides[get_db] = override_get_db
-
-    # Create async client
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test/api/v6",
-    ) as client:
-        yield client
-
-    # Clean up
-    app.dependency_overrides.clear()
+    async with app.router.lifespan_context(app):
+        yield app
 
 
 @pytest.fixture(scope="session")
-async def test_engine(database_url):
+async def async_client(test_app) -> AsyncGenerator[AsyncClient, None]:
     """
-    Creates async SQLAlchemy engine connected to temporary database.
+    Creates one async HTTP client shared by every test in the session.
+
+    The transport and client are built once; each test's database session
+    is wired in by override_get_session.
 
     Args:
-        database_url: URL from database_url fixture
+        test_app: App whose lifespan has already been entered
 
-    Returns:
-        AsyncEngine: SQLAlchemy async engine
+    Yields:
+        AsyncClient: HTTP client for making requests
     """
-    # Create async engine
-    engine = create_async_engine(
-        database_url,
-        echo=False,  # Set to True to see SQL queries (useful for debugging)
-        poolclass=NullPool,  # Don't pool connections in tests
-        future=True,
-    )
-
-    yield engine
-
-    # Dispose engine
-    await engine.dispose()
+    async with AsyncClient(
+        transport=ASGITransport(app=test_app),
+        base_url="http://localhost",
+    ) as client:
+        yield client
 
 
 @pytest.fixture
-async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
+def bare_client(async_client: AsyncClient) -> Iterator[AsyncClient]:
     """
-    Creates a fresh database with clean tables for each test.
+    The shared HTTP client, for tests that are rejected before any query runs.
+
+    No db_session is checked out. FastAPI still resolves the app's
+    database dependency on rejected requests, so it yields a stand-in that
+    fails the test on first use instead of falling through to the real
+    DATABASE_URL.
     """
-    # Drop and recreate all tables before each test
-    async with test_engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
-        await conn.run_sync(SQLModel.metadata.create_all)
 
-    # Create session
-    async_session_maker = async_sessionmaker(
-        bind=test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    class NoDatabaseSession:
+        def __getattr__(self, name):
+            pytest.fail(f"bare_client test reached the database (session.{name})")
 
-    async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+    async def override():
+        yield NoDatabaseSession()
 
+    app.dependency_overrides[get_session] = override
 
-@pytest.fixture
-async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """
-    Creates an async HTTP client for testing API endpoints.
+    yield async_client
 
+    app.dependency_overrides.pop(get_session, None)
 
 
-    Args:
-        db_session: Database session from db_session fixture
+@pytest.fixture(autouse=True)
+def override_get_session(request):
+    """
+    Points the app's database dependency at the current test's db_session.
 
-    Yields:
-        AsyncClient: HTTP client for making requests
+    Only tests that talk to the app or the database get a db_session;
+    plain unit tests never start Postgres, and bare_client installs its
+    own override.
     """
+    fixtures = set(request.fixturenames)
+    if "bare_client" in fixtures or not fixtures & {"async_client", "db_session"}:
+        yield
+        return
+
+    db_session = request.getfixturevalue("db_session")
 
-    # Override the database dependency
-    async def override_get_session():
+    async def override():
         yield db_session
 
-    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_session] = override
 
-    # Create async client
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://localhost",
-    ) as client:
-        yield client
+    yield
 
     # Clean up
     app.dependency_overrides.clear()
@@ -350,7 +385,8 @@ def mock_otp(monkeypatch):
     return 123456
 
 
-@pytest.fixture
+# Registration payloads are built once per session; tests copy() before editing
+@pytest.fixture(scope="session")
 def valid_user_data():
     """
     Provides valid user registration data.
@@ -367,7 +403,7 @@ def valid_user_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def another_user_data():
     """
     Provides different user data for testing multiple users.
@@ -384,7 +420,7 @@ def another_user_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user2_data():
     return {
         "email": "user2@example.com",
@@ -395,7 +431,7 @@ def user2_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user3_data():
     return {
         "email": "user3@example.com",
@@ -406,7 +442,7 @@ def user3_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_user_data():
     return {
         "email": "invalid-email",
@@ -417,7 +453,7 @@ def invalid_user_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def weak_password_data():
     return {
         "email": "test@example.com",
@@ -437,12 +473,7 @@ async def registered_user(
     """
     Creates a registered but unverified user for testing.
     """
-    from src.auth.service import UserService
-
-    user_service = UserService()
-    user_create = UserCreate(**user2_data)
-    user = await user_service.create_user(user_create, db_session)
-    return user
+    return await create_test_user(db_session, user2_data)
 
 
 @pytest.fixture
@@ -454,14 +485,16 @@ async def verified_user(
     """
     Creates a verified user for testing.
     """
-    from src.auth.service import UserService
+    return await create_test_user(db_session, user3_data, is_email_verified=True)
 
-    user_service = UserService()
-    user_create = UserCreate(**user3_data)
-    user = await user_service.create_user(user_create, db_session)
 
-    await user_service.update_user(user, {"is_email_verified": True}, db_session)
-    return user
+@pytest.fixture
+def auth_headers(verified_user: User) -> dict:
+    """
+    Authorization headers for verified_user, minted directly instead of
+    going through the login endpoint.
+    """
+    return auth_header(verified_user)
 
 
 @pytest.fixture
@@ -473,14 +506,7 @@ async def another_verified_user(
     """
     Creates a verified user for testing.
     """
-    from src.auth.service import UserService
-
-    user_service = UserService()
-    user_create = UserCreate(**valid_user_data)
-    user = await user_service.create_user(user_create, db_session)
-
-    await user_service.update_user(user, {"is_email_verified": True}, db_session)
-    return user
+    return await create_test_user(db_session, valid_user_data, is_email_verified=True)
 
 
 @pytest.fixture
@@ -490,16 +516,9 @@ async def inactive_user(
     another_user_data: dict,
 ):
 
-    from src.auth.service import UserService
-
-    user_service = UserService()
-    user_create = UserCreate(**another_user_data)
-    user = await user_service.create_user(user_create, db_session)
-
-    await user_service.update_user(
-        user, {"is_email_verified": True, "is_active": False}, db_session
+    return await create_test_user(
+        db_session, another_user_data, is_email_verified=True, is_active=False
     )
-    return user
 
 
 @pytest.fixture
@@ -580,20 +599,11 @@ async def profile_service():
 
 
 @pytest.fixture
-async def verified_user_with_profile(verified_user, db_session: AsyncSession):
+def verified_user_with_profile(verified_user):
     """
     Returns verified user with their profile.
-    Profile is automatically created via relationship.
     """
-    # The profile should already exist due to the relationship
-    # But let's ensure it's loaded
-    from sqlmodel import select
-
-    statement = select(Profile).where(Profile.user_id == verified_user.id)
-    result = await db_session.exec(statement)
-    profile = result.first()
-
-    return {"user": verified_user, "profile": profile}
+    return {"user": verified_user, "profile": verified_user.profile}
 
 
 @pytest.fixture
@@ -605,52 +615,59 @@ async def another_verified_user_with_profile(
     """
     Creates a second verified user for testing interactions between users.
     """
-    from src.auth.schemas import UserCreate
-    from src.auth.service import UserService
+    user = await create_test_user(db_session, another_user_data, is_email_verified=True)
 
-    user_service = UserService()
-    user_create = UserCreate(**another_user_data)
-    user = await user_service.create_user(user_create, db_session)
-    await user_service.update_user(user, {"is_email_verified": True}, db_session)
+    return {"user": user, "profile": user.profile}
 
-    # Get profile
-    from sqlmodel import select
 
-    statement = select(Profile).where(Profile.user_id == user.id)
-    result = await db_session.exec(statement)
-    profile = result.first()
+@pytest.fixture
+async def two_verified_users_with_profiles(
+    db_session: AsyncSession,
+    user3_data: dict,
+    another_user_data: dict,
+):
+    """
+    Creates verified_user and a second verified user in a single commit,
+    for tests that only need a couple of profiles to list.
+    """
+    user1 = build_test_user(user3_data, is_email_verified=True)
+    user2 = build_test_user(another_user_data, is_email_verified=True)
+    db_session.add_all([user1, user2])
+    await db_session.commit()
 
-    return {"user": user, "profile": profile}
+    return {
+        "user1": user1,
+        "user2": user2,
+        "profile1": user1.profile,
+        "profile2": user2.profile,
+    }
 
 
-@pytest.fixture
-async def sample_skills(db_session: AsyncSession):
-    """
-    Creates sample skills in the database.
+@pytest.fixture(scope="session")
+async def sample_skill_ids(test_engine):
     """
-    skills_data = [
-        {"name": "Python"},
-        {"name": "JavaScript"},
-        {"name": "React"},
-        {"name": "Django"},
-        {"name": "PostgreSQL"},
-    ]
+    Creates sample skills in the database once per session.
 
-    skills = []
-    for skill_data in skills_data:
-        skill = Skill(**skill_data)
-        db_session.add(skill)
-        skills.append(skill)
+    The rows are committed outside the per-test transaction, so they stay
+    in place for every later test.
 
-    await db_session.commit()
+    Returns:
+        list: (id, name) tuples, so tests only hold on to primary keys
+    """
+    skill_names = ["Python", "JavaScript", "React", "Django", "PostgreSQL"]
 
-    return skills
+    skills = [Skill(name=name) for name in skill_names]
+    async with AsyncSession(test_engine, expire_on_commit=False) as session:
+        session.add_all(skills)
+        await session.commit()
+
+    return [(skill.id, skill.name) for skill in skills]
 
 
 @pytest.fixture
 async def profile_with_skills(
     verified_user_with_profile,
-    sample_skills,
+    sample_skill_ids,
     db_session: AsyncSession,
 ):
     """
@@ -659,14 +676,16 @@ async def profile_with_skills(
     profile = verified_user_with_profile["profile"]
 
     # Add first 3 skills to the profile
-    for i in range(3):
-        profile_skill = ProfileSkill(
-            profile_id=profile.id,
-            skill_id=sample_skills[i].id,
-            description=f"Expert in {sample_skills[i].name}",
-        )
-        db_session.add(profile_skill)
-
+    db_session.add_all(
+        [
+            ProfileSkill(
+                profile_id=profile.id,
+                skill_id=skill_id,
+                description=f"Expert in {skill_name}",
+            )
+            for skill_id, skill_name in sample_skill_ids[:3]
+        ]
+    )
     await db_session.commit()
 
     return {"profile": profile, "user": verified_user_with_profile["user"]}
@@ -676,37 +695,34 @@ async def profile_with_skills(
 def mock_cloudinary(monkeypatch):
     """
     Mocks Cloudinary upload and delete operations.
+
+    The CloudinaryService attributes are replaced with mocks, so uploaded
+    files are never read and calls can be asserted on.
     """
     upload_result_url = (
         "https://res.cloudinary.com/test/image/upload/v123/test_avatar.jpg"
     )
 
-    # Wrap in staticmethod to match the original
-    @staticmethod
-    async def fake_upload_image(file, folder="avatars", public_id=None, overwrite=True):
-        """Mock upload"""
-        return upload_result_url
-
-    @staticmethod
-    async def fake_delete_image(public_id):
-        """Mock delete"""
-        return True
-
-    @staticmethod
-    def fake_extract_public_id(url):
-        """Mock extract"""
-        return "test_avatar"
+    upload_image = AsyncMock(return_value=upload_result_url)
+    delete_image = AsyncMock(return_value=True)
+    extract_public_id = Mock(return_value="test_avatar")
 
     from src.cloudinary_service import CloudinaryService
 
-    # Set the static methods directly
-    monkeypatch.setattr(CloudinaryService, "upload_image", fake_upload_image)
-    monkeypatch.setattr(CloudinaryService, "delete_image", fake_delete_image)
+    # Routes call these on an instance and services on the class;
+    # mocks are not descriptors, so one patch covers both
+    monkeypatch.setattr(CloudinaryService, "upload_image", upload_image)
+    monkeypatch.setattr(CloudinaryService, "delete_image", delete_image)
     monkeypatch.setattr(
-        CloudinaryService, "extract_public_id_from_url", fake_extract_public_id
+        CloudinaryService, "extract_public_id_from_url", extract_public_id
     )
 
-    return {"url": upload_result_url, "public_id": "test_avatar"}
+    return {
+        "url": upload_result_url,
+        "public_id": "test_avatar",
+        "upload_image": upload_image,
+        "delete_image": delete_image,
+    }
 
 
 @pytest.fixture
@@ -778,12 +794,8 @@ async def sample_tags(db_session: AsyncSession, sample_project):
         {"name": "Node.js", "project_id": sample_project.id},
     ]
 
-    tags = []
-    for tag_data in tags_data:
-        tag = Tag(**tag_data)
-        db_session.add(tag)
-        tags.append(tag)
-
+    tags = [Tag(**tag_data) for tag_data in tags_data]
+    db_session.add_all(tags)
     await db_session.commit()
 
     return tags
@@ -877,12 +889,8 @@ async def multiple_projects(
         },
     ]
 
-    projects = []
-    for project_data in projects_data:
-        project = Project(**project_data)
-        db_session.add(project)
-        projects.append(project)
-
+    projects = [Project(**project_data) for project_data in projects_data]
+    db_session.add_all(projects)
     await db_session.commit()
 
     return projects
@@ -1,4 +1,3 @@
-import pytest
 from httpx import AsyncClient
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -60,7 +59,6 @@ class TestUserRegistration:
         valid_data["password"] = "A" * 1000
 
         response = await async_client.post(self.register_url, json=valid_data)
-        print(response.json())
 
         assert response.status_code == 422
 
@@ -82,7 +80,6 @@ class TestUserRegistration:
         # Assert
         assert response.status_code == 422
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "user_exists"
 
     async def test_register_username_already_exists(
@@ -106,7 +103,6 @@ class TestUserRegistration:
         # Assert
         assert response.status_code == 422
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "username_exists"
 
     async def test_register_invalid_email(
@@ -300,7 +296,6 @@ class TestEmailVerification:
         # Assert
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert response_data["message"] == "Email address already verified."
@@ -355,7 +350,6 @@ class TestEmailVerification:
             response = await async_client.post(
                 self.verify_user_email, json=verification_data
             )
-            print(response.json())
 
             # Should either be validation error or invalid OTP error
             assert response.status_code == 422
@@ -366,7 +360,6 @@ class TestResendVerificationEmail:
 
     resend_verification = "/api/v1/auth/verification/email-resend"
 
-    @pytest.mark.asyncio
     async def test_resend_otp_success(
         self,
         async_client: AsyncClient,
@@ -388,7 +381,6 @@ class TestResendVerificationEmail:
         # Assert: Check response
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert response_data["message"] == "OTP sent successfully"
@@ -401,7 +393,6 @@ class TestResendVerificationEmail:
         user_service = UserService()
         # Assert: There should be exactly ONE new OTP for the user
         all_otps = await user_service.get_user_otps(registered_user.id, db_session)
-        print(all_otps)
         assert len(all_otps) == 1
 
     async def test_resend_otp_user_not_found(
@@ -452,7 +443,6 @@ class TestResendVerificationEmail:
 
         # Act
         response = await async_client.post(self.resend_verification, json=resend_data)
-        print(response.json())
         # Assert
         assert response.status_code == 422
 
@@ -502,7 +492,6 @@ class TestUserLogin:
 
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "failure"
         assert response_data["err_code"] == "unauthorized"
@@ -520,7 +509,6 @@ class TestUserLogin:
 
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "failure"
         assert response_data["err_code"] == "unauthorized"
@@ -559,7 +547,6 @@ class TestUserLogin:
 
         assert response.status_code == 403
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "forbidden"
 
     async def test_login_missing_email(
@@ -570,7 +557,6 @@ class TestUserLogin:
         login_data = {"password": "SomePassword123!"}
 
         response = await async_client.post(self.login_url, json=login_data)
-        print(response.json())
 
         assert response.status_code == 422
 
@@ -613,7 +599,6 @@ class TestUserLogin:
         response = await async_client.post(self.login_url, json=login_data)
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
         assert response_data["status"] == "success"
         assert "access" in response_data
         assert "refresh" in response_data
@@ -651,7 +636,6 @@ class TestLogout:
         retry_response = await async_client.post(
             self.logout_url, headers={"Authorization": f"Bearer {refresh_token}"}
         )
-        print(retry_response.json())
         assert retry_response.status_code == 401
 
     async def test_logout_without_token(
@@ -659,7 +643,6 @@ class TestLogout:
         async_client: AsyncClient,
     ):
         response = await async_client.post(self.logout_url)
-        print(response.json())
 
         assert response.status_code == 401
         response_data = response.json()
@@ -674,7 +657,6 @@ class TestLogout:
         response = await async_client.post(
             self.logout_url, headers={"Authorization": f"Bearer {invalid_token}"}
         )
-        print(response.json())
 
         assert response.status_code == 401
 
@@ -695,7 +677,6 @@ class TestLogout:
         response = await async_client.post(
             self.logout_url, headers={"Authorization": f"Bearer {access_token}"}
         )
-        print(response.json())
 
         assert response.status_code == 401
 
@@ -710,7 +691,6 @@ class TestLogout:
             headers={"Authorization": f"Bearer {expired_refresh_token}"},
         )
         response_data = response.json()
-        print(response_data)
 
         assert response.status_code == 401
         assert response_data["err_code"] == "invalid_token"
@@ -734,14 +714,12 @@ class TestLogout:
         first_logout = await async_client.post(
             self.logout_url, headers={"Authorization": f"Bearer {refresh_token}"}
         )
-        print(first_logout.json())
         assert first_logout.status_code == 200
 
         # Try to logout again with same token
         second_logout = await async_client.post(
             self.logout_url, headers={"Authorization": f"Bearer {refresh_token}"}
         )
-        print(second_logout.json())
 
         # Second logout should fail
         assert second_logout.status_code == 401
@@ -787,7 +765,6 @@ class TestLogoutAll:
         # Assert: Check response
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
         assert response_data["status"] == "success"
         assert "all devices" in response_data["message"].lower()
 
@@ -819,7 +796,6 @@ class TestLogoutAll:
 
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "unauthorized"
 
     async def test_logout_all_with_invalid_token(
@@ -831,7 +807,6 @@ class TestLogoutAll:
         response = await async_client.post(
             self.logout_all_url, headers={"Authorization": f"Bearer {invalid_token}"}
         )
-        print(response.json())
 
         assert response.status_code == 401
 
@@ -857,7 +832,6 @@ class TestLogoutAll:
 
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "access_token_required"
 
 
@@ -892,7 +866,6 @@ class TestTokenRefresh:
         # Assert: Check response
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert "Token refreshed successfully" in response_data["message"]
@@ -931,7 +904,6 @@ class TestTokenRefresh:
         # Assert: Should fail because old token is blacklisted
         assert retry_response.status_code == 401
         response_data = retry_response.json()
-        print(response_data)
         assert response_data["err_code"] == "invalid_token"
 
     async def test_refresh_token_without_token(
@@ -942,7 +914,6 @@ class TestTokenRefresh:
 
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "unauthorized"
 
     async def test_refresh_with_access_token(
@@ -968,7 +939,6 @@ class TestTokenRefresh:
         # Should fail
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "refresh_token_required"
 
     async def test_refresh_with_invalid_token(
@@ -984,7 +954,6 @@ class TestTokenRefresh:
 
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "invalid_token"
 
     async def test_refresh_with_expired_token(
@@ -998,7 +967,6 @@ class TestTokenRefresh:
             headers={"Authorization": f"Bearer {expired_refresh_token}"},
         )
         response_data = response.json()
-        print(response_data)
 
         assert response.status_code == 401
         assert response_data["err_code"] == "invalid_token"
@@ -1029,7 +997,6 @@ class TestTokenRefresh:
         # Should fail
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "invalid_token"
 
     async def test_refresh_after_logout_all(
@@ -1063,8 +1030,6 @@ class TestTokenRefresh:
 
         # Should fail because all tokens are blacklisted
         assert response.status_code == 401
-        response_data = response.json()
-        print(response_data)
 
 
 class TestPasswordResetRequest:
@@ -1080,7 +1045,6 @@ class TestPasswordResetRequest:
 
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert "If that email address is in our database" in response_data["message"]
@@ -1089,7 +1053,6 @@ class TestPasswordResetRequest:
         email_data = mock_email[0]
         assert email_data["email_to"] == verified_user.email
         assert "otp" in email_data["template_context"]
-        print(email_data["template_context"])
         assert email_data["template_name"] == "password_reset_email.html"
 
     async def test_password_reset_request_nonexistent_user(
@@ -1105,7 +1068,6 @@ class TestPasswordResetRequest:
         # Response looks identical to success case (security measure)
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert "If that email address is in our database" in response_data["message"]
@@ -1122,10 +1084,8 @@ class TestPasswordResetRequest:
     ):
 
         reset_data = {"email": registered_user.email}
-        print(reset_data)
 
         response = await async_client.post(self.reset_url, json=reset_data)
-        print(response.json())
 
         # Should succeed (unverified users can reset password)
         assert response.status_code == 200
@@ -1145,7 +1105,6 @@ class TestPasswordResetRequest:
         reset_data = {"email": inactive_user.email}
 
         response = await async_client.post(self.reset_url, json=reset_data)
-        print(response.json())
 
         # Assert: Response is same (doesn't reveal account status)
         assert response.status_code == 200
@@ -1166,8 +1125,6 @@ class TestPasswordResetRequest:
 
         # Validation error
         assert response.status_code == 422
-        response_data = response.json()
-        print(response_data)
 
     async def test_password_reset_request_case_insensitive_email(
         self,
@@ -1204,7 +1161,6 @@ class TestPasswordResetVerifyOtp:
         otp_record = Otp(user_id=registered_user.id, otp=otp, is_valid=True)
         db_session.add(otp_record)
         await db_session.commit()
-        print(otp_record)
 
         # Verify the OTP
         response = await async_client.post(
@@ -1217,7 +1173,6 @@ class TestPasswordResetVerifyOtp:
 
         assert response.status_code == 200
         data = response.json()
-        print(data)
         assert data["status"] == "success"
         assert "proceed to set a new password" in data["message"].lower()
 
@@ -1245,7 +1200,6 @@ class TestPasswordResetVerifyOtp:
 
         # assert response.status_code == 200
         data = response.json()
-        print(data)
         assert data["status"] == "failure"
         assert "disabled" in data["message"].lower()
 
@@ -1263,7 +1217,6 @@ class TestPasswordResetVerifyOtp:
 
         assert response.status_code == 404
         data = response.json()
-        print(data)
         assert data["err_code"] == "not_found"
 
     async def test_verify_otp_no_reset_requested(
@@ -1279,7 +1232,6 @@ class TestPasswordResetVerifyOtp:
         # Assert
         assert response.status_code == 422
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "invalid_otp"
 
     async def test_verify_otp_expired(
@@ -1299,7 +1251,6 @@ class TestPasswordResetVerifyOtp:
         )
         db_session.add(expired_otp)
         await db_session.commit()
-        print(expired_otp)
 
         # Act: Try to verify expired OTP
         verify_data = {"email": verified_user.email, "otp": 123456}
@@ -1308,7 +1259,6 @@ class TestPasswordResetVerifyOtp:
         # Assert
         assert response.status_code == 422
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "invalid_otp"
 
     async def test_verify_otp_missing_email(
@@ -1322,8 +1272,6 @@ class TestPasswordResetVerifyOtp:
 
         # Assert
         assert response.status_code == 422
-        response_data = response.json()
-        print(response_data)
 
     async def test_verify_otp_missing_otp(
         self,
@@ -1337,8 +1285,6 @@ class TestPasswordResetVerifyOtp:
 
         # Assert
         assert response.status_code == 422
-        response_data = response.json()
-        print(response_data)
 
     async def test_verify_otp_case_insensitive_email(
         self,
@@ -1355,7 +1301,6 @@ class TestPasswordResetVerifyOtp:
         )
         db_session.add(otp)
         await db_session.commit()
-        print(otp)
 
         # Act: Verify with uppercase email
         verify_data = {"email": verified_user.email.upper(), "otp": 123456}
@@ -1364,7 +1309,6 @@ class TestPasswordResetVerifyOtp:
         # Assert: Should succeed
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
         assert response_data["status"] == "success"
 
 
@@ -1394,7 +1338,6 @@ class TestPasswordResetComplete:
         # Assert: Check response
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert "password has been reset" in response_data["message"].lower()
@@ -1434,7 +1377,6 @@ class TestPasswordResetComplete:
         # Assert
         assert response.status_code == 404
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "not_found"
 
     async def test_password_reset_complete_password_mismatch(
@@ -1454,9 +1396,6 @@ class TestPasswordResetComplete:
 
         # Assert: Should fail validation
         assert response.status_code == 422
-        response_data = response.json()
-        print(response_data)
-        # Pydantic validation error for password mismatch
 
     async def test_password_reset_complete_weak_password(
         self,
@@ -1476,9 +1415,6 @@ class TestPasswordResetComplete:
 
         # Assert: Should fail validation
         assert response.status_code == 422
-        response_data = response.json()
-        print(response_data)
-        # Pydantic validation error for weak password
 
     async def test_password_reset_complete_missing_fields(
         self,
@@ -1492,7 +1428,6 @@ class TestPasswordResetComplete:
             "confirm_new_password": "NewSecurePass123!",
         }
         response = await async_client.post(self.complete_url, json=reset_data)
-        print(response.json())
         assert response.status_code == 422
 
         # Test missing new_password
@@ -1501,7 +1436,6 @@ class TestPasswordResetComplete:
             "confirm_new_password": "NewSecurePass123!",
         }
         response = await async_client.post(self.complete_url, json=reset_data)
-        print(response.json())
         assert response.status_code == 422
 
         # Test missing confirm_new_password
@@ -1510,7 +1444,6 @@ class TestPasswordResetComplete:
             "new_password": "NewSecurePass123!",
         }
         response = await async_client.post(self.complete_url, json=reset_data)
-        print(response.json())
         assert response.status_code == 422
 
     async def test_password_reset_complete_case_insensitive_email(
@@ -1533,7 +1466,6 @@ class TestPasswordResetComplete:
         # Assert: Should succeed
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
         assert response_data["status"] == "success"
 
         # Assert: Email was sent to lowercase email
@@ -1559,7 +1491,6 @@ class TestPasswordResetComplete:
         # Assert: Should succeed (inactive users can reset password)
         assert response.status_code == 403
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "forbidden"
 
     async def test_password_reset_complete_unverified_user(
@@ -1582,7 +1513,6 @@ class TestPasswordResetComplete:
         # Assert: Should succeed (unverified users can reset password)
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
         assert response_data["status"] == "success"
 
         # Assert: Success email was sent
@@ -1628,7 +1558,6 @@ class TestPasswordChange:
         # Assert: Check response
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert "Password changed successfully" in response_data["message"]
@@ -1679,7 +1608,6 @@ class TestPasswordChange:
         # Assert
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "invalid_old_password"
 
     async def test_password_change_weak_new_password(
@@ -1711,9 +1639,6 @@ class TestPasswordChange:
         )
         # Assert: Should fail validation
         assert response.status_code == 422
-        response_data = response.json()
-        print(response_data)
-        # Pydantic validation error for weak password
 
     async def test_password_change_unauthenticated(
         self,
@@ -1730,7 +1655,6 @@ class TestPasswordChange:
         # Assert
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "unauthorized"
 
     async def test_password_change_old_tokens_blacklisted(
@@ -1769,7 +1693,6 @@ class TestPasswordChange:
             "/api/v1/auth/token/refresh",
             headers={"Authorization": f"Bearer {old_refresh}"},
         )
-        print(refresh_response.json())
         assert refresh_response.status_code == 401
 
     async def test_password_change_same_as_old_password(
@@ -1803,7 +1726,6 @@ class TestPasswordChange:
         # Assert: Should not succeed
         assert response.status_code == 422
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "password_same_as_old"
 
     async def test_password_change_missing_fields(
@@ -1832,7 +1754,6 @@ class TestPasswordChange:
             json=change_data,
             headers={"Authorization": f"Bearer {access_token}"},
         )
-        print(response.json())
         assert response.status_code == 422
 
         # Test missing new_password
@@ -1845,7 +1766,6 @@ class TestPasswordChange:
             json=change_data,
             headers={"Authorization": f"Bearer {access_token}"},
         )
-        print(response.json())
         assert response.status_code == 422
 
         # Test missing confirm_new_password
@@ -1,19 +1,44 @@
-from httpx import AsyncClient
+import base64
+from io import BytesIO
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+from httpx import URL, AsyncClient
+from pydantic import ValidationError
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import exists, func
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.db.models import Profile, ProfileSkill, Skill, User
+from src.db.models import ProfileSkill, Skill, User
+from src.db.redis import PROFILE_COUNT_PREFIX, cache_count, count_cache_key
+from src.profiles.schemas import PaginationParams, ProfileListResponse
+
+# Parsed once so the client doesn't rebuild the URL on every request
+PROFILES_URL = URL("/api/v1/profiles/")
+ME_URL = URL("/api/v1/profiles/me")
+AVATAR_URL = URL("/api/v1/profiles/avatar")
+MY_SKILLS_URL = URL("/api/v1/profiles/me/skills")
+
+# Well-known id that no fixture ever seeds
+MISSING_SKILL_ID = "00000000-0000-0000-0000-000000000000"
+
+
+def encode_raw_cursor(raw: str) -> str:
+    """Encodes a hand-built cursor payload the way encode_cursor does"""
+    return base64.urlsafe_b64encode(raw.encode()).decode()
 
 
 class TestGetProfiles:
     """Test suite for GET /profiles/ endpoint"""
 
-    get_profiles_url = "/api/v1/profiles/"
+    get_profiles_url = PROFILES_URL
 
+    @pytest.mark.usefixtures("two_verified_users_with_profiles")
     async def test_get_profiles_success(
         self,
         async_client: AsyncClient,
-        verified_user_with_profile,
-        another_verified_user_with_profile,
     ):
         """
         Test successfully retrieving all profiles.
@@ -23,90 +48,100 @@ class TestGetProfiles:
 
         # Assert
         assert response.status_code == 200
-        response_data = response.json()
-
-        # Should return a list
-        print(response_data)
-
-        # Check top-level structure
-        assert "status" in response_data
-        assert "message" in response_data
-        assert "data" in response_data
 
-        # Check pagination structure
-        data = response_data["data"]
-        assert "count" in data
-        assert "next" in data
-        assert "previous" in data
-        assert "results" in data
+        # Check the whole payload against the response schema in one pass
+        body = ProfileListResponse.model_validate_json(response.content)
+        # next/previous default to None in the schema, so check they were sent
+        assert {"next", "previous"} <= response.json()["data"].keys()
 
         # Check results
-        assert len(data["results"]) >= 2  # At least 2 profiles
-        print(len(data["results"]) >= 2)
+        assert len(body.data.results) >= 2  # At least 2 profiles
 
-        # Check structure of first profile
-        if len(data["results"]) > 0:
-            profile = data["results"][0]
-            assert "id" in profile
-            assert "user_id" in profile
-            assert "username" in profile
-            assert "full_name" in profile
+    async def test_get_profiles_fresh_session(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        two_verified_users_with_profiles,
+    ):
+        """
+        Test listing profiles whose users are not already in the session,
+        as on a fresh request session in production.
+        """
+        # Arrange: Forget the fixture instances
+        db_session.expunge_all()
+
+        # Act
+        response = await async_client.get(self.get_profiles_url)
 
+        # Assert
+        assert response.status_code == 200
+        usernames = {p["username"] for p in response.json()["data"]["results"]}
+        assert usernames == {"user3", "anotheruser"}
+
+    @pytest.mark.parametrize(
+        "search",
+        # user3 is profile1's username; profile2 (anotheruser) matches none
+        ["Python", "San Francisco", "user3"],
+        ids=["intro", "location", "username"],
+    )
     async def test_get_profiles_with_search(
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
-        verified_user_with_profile,
+        two_verified_users_with_profiles,
+        search: str,
     ):
         """
         Test searching profiles by username, intro, or location.
         """
-        # Arrange: Update profile with searchable data
-        profile = verified_user_with_profile["profile"]
+        # Arrange: Update one profile with searchable data
+        profile = two_verified_users_with_profiles["profile1"]
         profile.short_intro = "Python developer with 5 years experience"
         profile.location = "San Francisco, CA"
-        db_session.add(profile)
-        await db_session.commit()
+        await db_session.flush()
 
-        # Act: Search by intro keyword
+        # Act
         response = await async_client.get(
-            self.get_profiles_url, params={"search": "Python"}
+            self.get_profiles_url, params={"search": search}
         )
 
-        # Assert
+        # Assert: Only the edited profile matches
         assert response.status_code == 200
         response_data = response.json()["data"]["results"]
-        assert len(response_data) >= 1
+        assert len(response_data) == 1
+        assert response_data[0]["id"] == str(profile.id)
+        assert response_data[0]["username"] == "user3"
 
-        # Act: Search by location
-        response = await async_client.get(
-            self.get_profiles_url, params={"search": "San Francisco"}
-        )
-
-        # Assert
-        assert response.status_code == 200
-        response_data = response.json()["data"]["results"]
-        assert len(response_data) >= 1
+    async def test_get_profiles_search_matches_word_forms(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        two_verified_users_with_profiles,
+    ):
+        """
+        Test that intro search matches on stemmed words, not raw substrings.
+        """
+        # Arrange
+        profile = two_verified_users_with_profiles["profile1"]
+        profile.short_intro = "Python developer with 5 years experience"
+        await db_session.flush()
 
-        # Act: Search by username
-        user = verified_user_with_profile["user"]
+        # Act: "developers" stems to the same lexeme as "developer"
         response = await async_client.get(
-            self.get_profiles_url, params={"search": user.username}
+            self.get_profiles_url, params={"search": "developers"}
         )
 
         # Assert
         assert response.status_code == 200
-        response_data = response.json()["data"]["results"]
-        assert len(response_data) >= 1
+        assert response.json()["data"]["count"] == 1
 
+    @pytest.mark.usefixtures("two_verified_users_with_profiles")
     async def test_get_profiles_with_pagination(
         self,
         async_client: AsyncClient,
-        verified_user_with_profile,
-        another_verified_user_with_profile,
     ):
         """
-        Test pagination with limit and offset.
+        Test pagination by following the next cursor.
         """
         # Act: Get first profile
         response = await async_client.get(
@@ -115,19 +150,166 @@ class TestGetProfiles:
 
         # Assert
         assert response.status_code == 200
-        response_data = response.json()["data"]
-        assert len(response_data["results"]) == 1
-        assert response_data["count"] >= 2  # Total count should be at least 2
+        first_page = response.json()["data"]
+        assert len(first_page["results"]) == 1
+        assert first_page["count"] == 2
+        assert "cursor=" in first_page["next"]
 
-        # Act: Get second profile
+        # Act: Follow the next link to the second profile
+        response = await async_client.get(first_page["next"])
+
+        # Assert
+        assert response.status_code == 200
+        second_page = response.json()["data"]
+        assert len(second_page["results"]) == 1
+        assert second_page["results"][0]["id"] != first_page["results"][0]["id"]
+        assert second_page["next"] is None
+        assert second_page["previous"] is None
+
+    @pytest.mark.usefixtures("two_verified_users_with_profiles")
+    async def test_get_profiles_with_offset(
+        self,
+        async_client: AsyncClient,
+    ):
+        """
+        Test legacy offset pagination and its previous link.
+        """
+        # Act: Skip the newest profile
         response = await async_client.get(
             self.get_profiles_url, params={"limit": 1, "offset": 1}
         )
 
         # Assert
         assert response.status_code == 200
-        response_data = response.json()["data"]
-        assert len(response_data["results"]) <= 1
+        data = response.json()["data"]
+        assert len(data["results"]) == 1
+        assert data["count"] == 2
+        assert data["next"] is None
+        assert data["previous"].endswith("?limit=1&offset=0")
+
+    @pytest.mark.usefixtures("two_verified_users_with_profiles")
+    async def test_get_profiles_count_served_from_cache(
+        self,
+        async_client: AsyncClient,
+    ):
+        """
+        Test that the total count comes from the Redis cache once cached.
+        """
+        # Arrange: Prime the cache, then overwrite it with a sentinel
+        response = await async_client.get(self.get_profiles_url)
+        assert response.json()["data"]["count"] == 2
+        await cache_count(await count_cache_key(PROFILE_COUNT_PREFIX, ""), 99)
+
+        # Act
+        response = await async_client.get(self.get_profiles_url)
+
+        # Assert: The count is the cached value, not a fresh COUNT(*)
+        assert response.json()["data"]["count"] == 99
+
+    @pytest.mark.usefixtures("two_verified_users_with_profiles")
+    async def test_get_profiles_count_invalidated_on_new_profile(
+        self,
+        async_client: AsyncClient,
+        redis_client,
+        valid_user_data: dict,
+        mock_email: list,
+    ):
+        """
+        Test that registering a user drops the cached profile counts.
+        """
+        # Arrange: Cache the unfiltered and a search count
+        response = await async_client.get(self.get_profiles_url)
+        assert response.json()["data"]["count"] == 2
+        await async_client.get(self.get_profiles_url, params={"search": "user"})
+        keys = [await count_cache_key(PROFILE_COUNT_PREFIX, t) for t in ("", "user")]
+        assert await redis_client.exists(*keys) == 2
+
+        # Act: Registration creates a third profile
+        response = await async_client.post(
+            "/api/v1/auth/register", json=valid_user_data
+        )
+        assert response.status_code == 201
+
+        # Assert: Every cached count is retired and the next count is fresh
+        for term, key in zip(("", "user"), keys):
+            assert await count_cache_key(PROFILE_COUNT_PREFIX, term) != key
+        data = (await async_client.get(self.get_profiles_url)).json()["data"]
+        assert len(data["results"]) == 3
+        assert data["count"] == 3
+
+    async def test_get_profiles_count_invalidated_on_profile_update(
+        self,
+        async_client: AsyncClient,
+        auth_headers: dict,
+    ):
+        """
+        Test that editing a profile drops cached search counts.
+        """
+        # Arrange: Cache a search count with no matches
+        params = {"search": "Python"}
+        response = await async_client.get(self.get_profiles_url, params=params)
+        assert response.json()["data"]["count"] == 0
+
+        # Act: Make the profile match the search
+        response = await async_client.patch(
+            ME_URL,
+            json={"short_intro": "Python developer"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+
+        # Assert
+        response = await async_client.get(self.get_profiles_url, params=params)
+        assert response.json()["data"]["count"] == 1
+
+    @pytest.mark.usefixtures("two_verified_users_with_profiles")
+    async def test_get_profiles_count_without_redis(
+        self,
+        async_client: AsyncClient,
+        redis_client,
+        monkeypatch,
+    ):
+        """
+        Test that the list still counts profiles when Redis is unavailable.
+        """
+        # Arrange: Every cache read and write fails
+        outage = AsyncMock(side_effect=RedisConnectionError("Redis is down"))
+        monkeypatch.setattr(redis_client, "get", outage)
+        monkeypatch.setattr(redis_client, "set", outage)
+
+        # Act
+        response = await async_client.get(self.get_profiles_url)
+
+        # Assert: Falls back to COUNT(*)
+        assert response.status_code == 200
+        assert response.json()["data"]["count"] == 2
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-a-cursor",
+            encode_raw_cursor(f"2024-01-01T00:00:00|{UUID(int=0)}"),
+            encode_raw_cursor(f"yesterday|{UUID(int=0)}"),
+            encode_raw_cursor("2024-01-01T00:00:00+00:00"),
+        ],
+        ids=["not-base64", "naive-timestamp", "bad-timestamp", "missing-id"],
+    )
+    async def test_get_profiles_invalid_cursor(
+        self,
+        bare_client: AsyncClient,
+        cursor: str,
+    ):
+        """
+        Test that a malformed cursor is rejected.
+        """
+        # Act
+        response = await bare_client.get(
+            self.get_profiles_url, params={"cursor": cursor}
+        )
+
+        # Assert
+        assert response.status_code == 422
+        assert response.json()["err_code"] == "unprocessable_entity"
 
     async def test_get_profiles_empty_db(
         self,
@@ -145,71 +327,62 @@ class TestGetProfiles:
         response_data = response.json()["data"]
         assert response_data["count"] == 0
         assert len(response_data["results"]) == 0
-        print(response_data)
 
+    @pytest.mark.parametrize(
+        "params",
+        [{"limit": -1}, {"offset": -1}, {"limit": 101}],
+        ids=["negative-limit", "negative-offset", "limit-too-high"],
+    )
     async def test_get_profiles_invalid_pagination_params(
         self,
-        async_client: AsyncClient,
+        bare_client: AsyncClient,
+        params: dict,
     ):
         """
         Test with invalid pagination parameters.
         """
-        # Act: Negative limit
-        response = await async_client.get(self.get_profiles_url, params={"limit": -1})
-
-        # Assert: Should fail validation
-        assert response.status_code == 422
-        print(response.json())
-
-        # Act: Negative offset
-        response = await async_client.get(self.get_profiles_url, params={"offset": -1})
+        # Act
+        response = await bare_client.get(self.get_profiles_url, params=params)
 
         # Assert: Should fail validation
         assert response.status_code == 422
-        print(response.json())
-
-        # Act: Limit too high
-        response = await async_client.get(self.get_profiles_url, params={"limit": 101})
 
-        # Assert: Should fail validation
-        assert response.status_code == 422
-        print(response.json())
+    @pytest.mark.parametrize(
+        "params",
+        [{"limit": -1}, {"offset": -1}, {"limit": 101}],
+        ids=["negative-limit", "negative-offset", "limit-too-high"],
+    )
+    def test_pagination_params_validation_unit(self, params: dict):
+        """
+        Test the pagination bounds on the model directly, without a request.
+        """
+        with pytest.raises(ValidationError):
+            PaginationParams(**params)
 
 
 class TestGetMyProfile:
     """Test suite for GET /profiles/me endpoint"""
 
-    get_my_profile_url = "/api/v1/profiles/me"
-    login_url = "/api/v1/auth/token"
+    get_my_profile_url = ME_URL
 
     async def test_get_my_profile_success(
         self,
         async_client: AsyncClient,
         verified_user: User,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test successfully retrieving current user's profile.
         """
-        # Arrange: Login to get access token
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: Get my profile
         response = await async_client.get(
             self.get_my_profile_url,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert "Profile retrieved successfully" in response_data["message"]
@@ -227,67 +400,54 @@ class TestGetMyProfile:
 
     async def test_get_my_profile_unauthenticated(
         self,
-        async_client: AsyncClient,
+        bare_client: AsyncClient,
     ):
         """
         Test retrieving profile without authentication.
         """
         # Act: Try to get profile without token
-        response = await async_client.get(self.get_my_profile_url)
+        response = await bare_client.get(self.get_my_profile_url)
 
         # Assert
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "unauthorized"
 
     async def test_get_my_profile_invalid_token(
         self,
-        async_client: AsyncClient,
+        bare_client: AsyncClient,
     ):
         """
         Test retrieving profile with invalid token.
         """
         # Act: Use invalid token
-        response = await async_client.get(
+        response = await bare_client.get(
             self.get_my_profile_url,
             headers={"Authorization": "Bearer invalid.token.here"},
         )
 
         # Assert
         assert response.status_code == 401
-        response_data = response.json()
-        print(response_data)
+        assert response.json()["err_code"] == "invalid_token"
 
     async def test_get_my_profile_with_skills(
         self,
         async_client: AsyncClient,
         profile_with_skills,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test retrieving profile that has skills.
         """
-        # Arrange: Login
-        user = profile_with_skills["user"]
-        login_data = {
-            "email": user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: Get my profile
         response = await async_client.get(
             self.get_my_profile_url,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         data = response_data["data"]
         assert "skills" in data
@@ -303,31 +463,20 @@ class TestGetMyProfile:
     async def test_get_my_profile_without_skills(
         self,
         async_client: AsyncClient,
-        verified_user: User,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test retrieving profile with no skills.
         """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: Get my profile
         response = await async_client.get(
             self.get_my_profile_url,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         data = response_data["data"]
         assert "skills" in data
@@ -338,28 +487,18 @@ class TestGetMyProfile:
 class TestUpdateMyProfile:
     """Test suite for PATCH /profiles/me endpoint"""
 
-    update_profile_url = "/api/v1/profiles/me"
-    login_url = "/api/v1/auth/token"
+    update_profile_url = ME_URL
 
     async def test_update_profile_success(
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
-        verified_user: User,
-        user3_data: dict,
+        verified_user_with_profile,
+        auth_headers: dict,
     ):
         """
         Test successfully updating profile with valid data.
         """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: Update profile
         update_data = {
             "short_intro": "Full-stack developer specializing in Python and React",
@@ -372,24 +511,20 @@ class TestUpdateMyProfile:
         response = await async_client.patch(
             self.update_profile_url,
             json=update_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert "Profile updated successfully" in response_data["message"]
         assert "data" in response_data
 
         # Verify database changes
-        from sqlmodel import select
-
-        statement = select(Profile).where(Profile.user_id == verified_user.id)
-        result = await db_session.exec(statement)
-        updated_profile = result.first()
+        updated_profile = verified_user_with_profile["profile"]
+        await db_session.refresh(updated_profile)
 
         assert updated_profile.short_intro == update_data["short_intro"]
         assert updated_profile.bio == update_data["bio"]
@@ -400,32 +535,18 @@ class TestUpdateMyProfile:
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
-        verified_user: User,
-        user3_data: dict,
+        verified_user_with_profile,
+        auth_headers: dict,
     ):
         """
         Test partial update (only updating some fields).
         """
-        # Arrange: Login and set initial data
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Set initial profile data
-        from sqlmodel import select
-
-        statement = select(Profile).where(Profile.user_id == verified_user.id)
-        result = await db_session.exec(statement)
-        profile = result.first()
+        profile = verified_user_with_profile["profile"]
 
         profile.short_intro = "Original intro"
         profile.location = "Original location"
-        db_session.add(profile)
-        await db_session.commit()
+        await db_session.flush()
 
         # Act: Update only short_intro
         update_data = {"short_intro": "Updated intro"}
@@ -433,7 +554,7 @@ class TestUpdateMyProfile:
         response = await async_client.patch(
             self.update_profile_url,
             json=update_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
@@ -462,7 +583,6 @@ class TestUpdateMyProfile:
         # Assert
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "unauthorized"
 
     async def test_update_profile_invalid_token(
@@ -483,56 +603,37 @@ class TestUpdateMyProfile:
 
         # Assert
         assert response.status_code == 401
-        response_data = response.json()
-        print(response_data)
+        assert response.json()["err_code"] == "invalid_token"
 
+    @pytest.mark.xfail(reason="URL fields are not validated yet", strict=True)
     async def test_update_profile_invalid_url_formats(
         self,
         async_client: AsyncClient,
-        verified_user: User,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test updating profile with invalid URL formats.
         """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: Invalid GitHub URL
         update_data = {"github": "not-a-valid-url"}
 
         response = await async_client.patch(
             self.update_profile_url,
             json=update_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
-        print(response.json())
+        # Assert
+        assert response.status_code == 422
 
     async def test_update_profile_empty_fields(
         self,
         async_client: AsyncClient,
-        verified_user: User,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test updating profile with empty strings (clearing fields).
         """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: Clear fields with empty strings or None
         update_data = {
             "short_intro": "",
@@ -543,73 +644,50 @@ class TestUpdateMyProfile:
         response = await async_client.patch(
             self.update_profile_url,
             json=update_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert: Should succeed (fields are optional)
-        print(response.json())
+        assert response.status_code == 200
 
     async def test_update_profile_exceeds_max_length(
         self,
         async_client: AsyncClient,
-        verified_user: User,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test updating profile with fields exceeding max length.
         """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: short_intro max is 200 chars
         update_data = {"short_intro": "A" * 201}
 
         response = await async_client.patch(
             self.update_profile_url,
             json=update_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert: Should fail validation
         assert response.status_code == 422
-        print(response.json())
 
 
 class TestUploadAvatar:
     """Test suite for POST /profiles/avatar endpoint"""
 
-    upload_avatar_url = "/api/v1/profiles/avatar"
-    login_url = "/api/v1/auth/token"
+    upload_avatar_url = AVATAR_URL
 
     async def test_upload_avatar_success(
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
-        verified_user: User,
-        user3_data: dict,
+        verified_user_with_profile,
         mock_cloudinary,
+        auth_headers: dict,
     ):
         """
         Test successfully uploading avatar image.
         """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Create fake image file
-        from io import BytesIO
-
         fake_image = BytesIO(b"fake image content")
 
         # Act: Upload avatar
@@ -618,13 +696,12 @@ class TestUploadAvatar:
         response = await async_client.post(
             self.upload_avatar_url,
             files=files,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert "Avatar uploaded successfully" in response_data["message"]
@@ -633,56 +710,38 @@ class TestUploadAvatar:
         assert response_data["avatar_url"] == mock_cloudinary["url"]
 
         # Verify database update
-        from sqlmodel import select
-
-        statement = select(Profile).where(Profile.user_id == verified_user.id)
-        result = await db_session.exec(statement)
-        profile = result.first()
+        profile = verified_user_with_profile["profile"]
+        await db_session.refresh(profile)
 
         assert profile.avatar_url == mock_cloudinary["url"]
+        mock_cloudinary["upload_image"].assert_awaited_once()
 
     async def test_upload_avatar_replace_existing(
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
-        verified_user: User,
-        user3_data: dict,
+        verified_user_with_profile,
         mock_cloudinary,
+        auth_headers: dict,
     ):
         """
         Test uploading avatar when user already has one (should replace).
         """
         # Arrange: Set existing avatar
-        from sqlmodel import select
-
-        statement = select(Profile).where(Profile.user_id == verified_user.id)
-        result = await db_session.exec(statement)
-        profile = result.first()
+        profile = verified_user_with_profile["profile"]
 
         old_avatar_url = "https://old-avatar-url.com/avatar.jpg"
         profile.avatar_url = old_avatar_url
-        db_session.add(profile)
-        await db_session.commit()
-
-        # Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
+        await db_session.flush()
 
         # Act: Upload new avatar
-        from io import BytesIO
-
         fake_image = BytesIO(b"new image content")
         files = {"file": ("new_avatar.jpg", fake_image, "image/jpeg")}
 
         response = await async_client.post(
             self.upload_avatar_url,
             files=files,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
@@ -693,6 +752,11 @@ class TestUploadAvatar:
         assert response_data["avatar_url"] == mock_cloudinary["url"]
         assert response_data["avatar_url"] != old_avatar_url
 
+        # The old image is removed from Cloudinary
+        mock_cloudinary["delete_image"].assert_awaited_once_with(
+            mock_cloudinary["public_id"]
+        )
+
     async def test_upload_avatar_unauthenticated(
         self,
         async_client: AsyncClient,
@@ -701,8 +765,6 @@ class TestUploadAvatar:
         Test uploading avatar without authentication.
         """
         # Act: Try to upload without token
-        from io import BytesIO
-
         fake_image = BytesIO(b"fake image content")
         files = {"file": ("avatar.jpg", fake_image, "image/jpeg")}
 
@@ -714,115 +776,74 @@ class TestUploadAvatar:
         # Assert
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "unauthorized"
 
     async def test_upload_avatar_invalid_file_type(
         self,
         async_client: AsyncClient,
-        verified_user: User,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test uploading non-image file as avatar.
         """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: Upload text file instead of image
-        from io import BytesIO
-
         fake_file = BytesIO(b"This is not an image")
         files = {"file": ("document.txt", fake_file, "text/plain")}
 
         response = await async_client.post(
             self.upload_avatar_url,
             files=files,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
         response_data = response.json()
 
         assert response_data["err_code"] == "image_upload_failed"
 
-        print(response.json())
-
     async def test_upload_avatar_missing_file(
         self,
         async_client: AsyncClient,
-        verified_user: User,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test uploading avatar without providing file.
         """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: Don't include file
         response = await async_client.post(
             self.upload_avatar_url,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert: Should fail validation
         assert response.status_code == 422
-        print(response.json())
 
 
 class TestDeleteAvatar:
     """Test suite for DELETE /profiles/avatar endpoint"""
 
-    delete_avatar_url = "/api/v1/profiles/avatar"
-    login_url = "/api/v1/auth/token"
+    delete_avatar_url = AVATAR_URL
 
     async def test_delete_avatar_success(
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
-        verified_user: User,
-        user3_data: dict,
+        verified_user_with_profile,
         mock_cloudinary,
+        auth_headers: dict,
     ):
         """
         Test successfully deleting avatar.
         """
         # Arrange: Set avatar URL
-        from sqlmodel import select
-
-        statement = select(Profile).where(Profile.user_id == verified_user.id)
-        result = await db_session.exec(statement)
-        profile = result.first()
+        profile = verified_user_with_profile["profile"]
 
         avatar_url = "https://res.cloudinary.com/test/image/upload/v123/user_avatar.jpg"
         profile.avatar_url = avatar_url
-        db_session.add(profile)
-        await db_session.commit()
-
-        # Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
+        await db_session.flush()
 
         # Act: Delete avatar
         response = await async_client.delete(
             self.delete_avatar_url,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
@@ -831,6 +852,9 @@ class TestDeleteAvatar:
         # Verify database update
         await db_session.refresh(profile)
         assert profile.avatar_url is None
+        mock_cloudinary["delete_image"].assert_awaited_once_with(
+            mock_cloudinary["public_id"]
+        )
 
     async def test_delete_avatar_unauthenticated(
         self,
@@ -845,44 +869,29 @@ class TestDeleteAvatar:
         # Assert
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "unauthorized"
 
     async def test_delete_avatar_no_avatar_exists(
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
-        verified_user: User,
-        user3_data: dict,
+        verified_user_with_profile,
         mock_cloudinary,
+        auth_headers: dict,
     ):
         """
         Test deleting avatar when user has no avatar set.
         """
         # Arrange: Ensure no avatar
-        from sqlmodel import select
-
-        statement = select(Profile).where(Profile.user_id == verified_user.id)
-        result = await db_session.exec(statement)
-        profile = result.first()
+        profile = verified_user_with_profile["profile"]
 
         profile.avatar_url = None
-        db_session.add(profile)
-        await db_session.commit()
-
-        # Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
+        await db_session.flush()
 
         # Act: Try to delete non-existent avatar
         response = await async_client.delete(
             self.delete_avatar_url,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert: Should still succeed (idempotent)
@@ -912,7 +921,6 @@ class TestGetUserProfile:
         # Assert
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert "Profile retrieved successfully" in response_data["message"]
@@ -934,7 +942,6 @@ class TestGetUserProfile:
         # Assert
         assert response.status_code == 404
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "not_found"
 
     async def test_get_user_profile_case_sensitive_username(
@@ -954,138 +961,119 @@ class TestGetUserProfile:
         # Assert
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert "Profile retrieved successfully" in response_data["message"]
         assert "data" in response_data
 
+    async def test_get_user_profile_wildcard_username_not_matched(
+        self,
+        async_client: AsyncClient,
+        verified_user: User,
+    ):
+        """
+        Test that LIKE wildcards in the username are matched literally.
+        """
+        # Act: "_" would match any single character under ILIKE
+        response = await async_client.get(
+            self.get_user_profile_url(verified_user.username[:-1] + "_")
+        )
+
+        # Assert
+        assert response.status_code == 404
+        assert response.json()["err_code"] == "not_found"
+
 
 class TestAddSkillToProfile:
     """Test suite for POST /profiles/me/skills endpoint"""
 
-    add_skill_url = "/api/v1/profiles/me/skills"
-    login_url = "/api/v1/auth/token"
+    add_skill_url = MY_SKILLS_URL
 
     async def test_add_skill_success(
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
-        verified_user: User,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test successfully adding a new skill to profile.
         """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
-        # Act: Add skill
+        # Act: Add a skill outside the session-wide sample_skill_ids set
         skill_data = {
-            "name": "Python",
+            "name": "Rust",
             "description": "5 years of professional experience",
         }
 
         response = await async_client.post(
             self.add_skill_url,
             json=skill_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 201
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert "Skill added to profile successfully" in response_data["message"]
         assert "data" in response_data
 
         data = response_data["data"]
-        assert data["name"] == "Python"
+        assert data["name"] == "Rust"
         assert data["description"] == skill_data["description"]
 
-        # Verify in database
-        from sqlmodel import select
+        # Verify in database: exactly one new Skill, linked by the response id
+        skill_id = (
+            await db_session.exec(select(Skill.id).where(Skill.name == "Rust"))
+        ).one()
 
-        statement = select(Skill).where(Skill.name == "Python")
-        result = await db_session.exec(statement)
-        skill = result.first()
-        assert skill is not None
+        profile_skill = await db_session.get(ProfileSkill, UUID(data["id"]))
+        assert profile_skill is not None
+        assert profile_skill.skill_id == skill_id
 
     async def test_add_skill_existing_skill(
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
-        verified_user: User,
-        sample_skills,
-        user3_data: dict,
+        sample_skill_ids,
+        auth_headers: dict,
     ):
         """
         Test adding a skill that already exists globally (should reuse existing).
         """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: Add skill that exists globally
-        existing_skill = sample_skills[0]  # "Python"
+        _, existing_name = sample_skill_ids[0]  # "Python"
         skill_data = {
-            "name": existing_skill.name,
+            "name": existing_name,
             "description": "My custom description",
         }
 
         response = await async_client.post(
             self.add_skill_url,
             json=skill_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 201
-        response_data = response.json()
-        print(response_data)
 
         # Verify it linked to existing skill, not created new one
-        from sqlmodel import select
-
-        statement = select(Skill).where(Skill.name == existing_skill.name)
+        statement = (
+            select(func.count()).select_from(Skill).where(Skill.name == existing_name)
+        )
         result = await db_session.exec(statement)
-        skills = result.all()
-        print(skills)
-        assert len(skills) == 1  # Should still be only one
+        assert result.one() == 1  # Should still be only one
 
     async def test_add_skill_duplicate(
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
         profile_with_skills,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test adding a skill that user already has (should fail).
         """
-        # Arrange: Login
-        user = profile_with_skills["user"]
-        login_data = {
-            "email": user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: Try to add skill user already has
         skill_data = {
             "name": "Python",  # User already has this from fixture
@@ -1095,66 +1083,33 @@ class TestAddSkillToProfile:
         response = await async_client.post(
             self.add_skill_url,
             json=skill_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 422
         response_data = response.json()
-        print(response_data)
         assert "already" in response_data["message"].lower()
 
-    async def test_add_skill_unauthenticated(
-        self,
-        async_client: AsyncClient,
-    ):
-        """
-        Test adding skill without authentication.
-        """
-        # Act
-        skill_data = {"name": "Python", "description": "Should fail"}
-
-        response = await async_client.post(
-            self.add_skill_url,
-            json=skill_data,
-        )
-
-        # Assert
-        assert response.status_code == 401
-        response_data = response.json()
-        print(response_data)
-        assert response_data["err_code"] == "unauthorized"
-
     async def test_add_skill_invalid_data(
         self,
         async_client: AsyncClient,
-        verified_user: User,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test adding skill with invalid data (empty name, description too long).
         """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: Empty skill name
         skill_data = {"name": "", "description": "Valid description"}
 
         response = await async_client.post(
             self.add_skill_url,
             json=skill_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 422
-        print(response.json())
 
         # Act: Name too long (max is 100)
         skill_data = {"name": "A" * 101, "description": "Valid description"}
@@ -1162,43 +1117,31 @@ class TestAddSkillToProfile:
         response = await async_client.post(
             self.add_skill_url,
             json=skill_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 422
-        print(response.json())
 
     async def test_add_skill_missing_fields(
         self,
         async_client: AsyncClient,
-        verified_user: User,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test adding skill with missing required fields.
         """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: Missing name
         skill_data = {"description": "No name provided"}
 
         response = await async_client.post(
             self.add_skill_url,
             json=skill_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 422
-        print(response.json())
 
 
 class TestGetUserSkills:
@@ -1225,7 +1168,6 @@ class TestGetUserSkills:
         # Assert
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         # Should return list of skills
         # assert isinstance(response_data, list)
@@ -1256,7 +1198,6 @@ class TestGetUserSkills:
         # Assert
         assert response.status_code == 404
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "not_found"
 
     async def test_get_user_skills_empty(
@@ -1277,7 +1218,6 @@ class TestGetUserSkills:
         # Assert
         assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         # Should return empty list
         assert len(response_data["data"]) == 0
@@ -1289,31 +1229,17 @@ class TestUpdateSkill:
     def get_update_skill_url(self, skill_id: str):
         return f"/api/v1/profiles/me/skills/{skill_id}"
 
-    login_url = "/api/v1/auth/token"
-
     async def test_update_skill_success(
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
         profile_with_skills,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test successfully updating a skill description.
         """
-        # Arrange: Login
-        user = profile_with_skills["user"]
-        login_data = {
-            "email": user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Get one of the user's skills
-        from sqlmodel import select
-
         profile = profile_with_skills["profile"]
         statement = select(ProfileSkill).where(ProfileSkill.profile_id == profile.id)
         result = await db_session.exec(statement)
@@ -1325,13 +1251,12 @@ class TestUpdateSkill:
         response = await async_client.patch(
             self.get_update_skill_url(profile_skill.id),
             json=update_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         # assert response.status_code == 200
         response_data = response.json()
-        print(response_data)
 
         assert response_data["status"] == "success"
         assert "Skill updated successfully" in response_data["message"]
@@ -1343,73 +1268,28 @@ class TestUpdateSkill:
         await db_session.refresh(profile_skill)
         assert profile_skill.description == update_data["description"]
 
-    async def test_update_skill_not_found(
-        self,
-        async_client: AsyncClient,
-        verified_user: User,
-        user3_data: dict,
-    ):
-        """
-        Test updating a skill that doesn't exist.
-        """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
-        # Act: Try to update non-existent skill
-        import uuid
-
-        fake_skill_id = str(uuid.uuid4())
-        update_data = {"description": "This should fail"}
-
-        response = await async_client.patch(
-            self.get_update_skill_url(fake_skill_id),
-            json=update_data,
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-
-        # Assert
-        assert response.status_code == 404
-        response_data = response.json()
-        print(response_data)
-        assert response_data["err_code"] == "not_found"
-
     async def test_update_skill_not_owned(
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
-        verified_user: User,
         another_verified_user_with_profile,
-        sample_skills,
-        user3_data: dict,
+        sample_skill_ids,
         another_user_data: dict,
+        auth_headers: dict,
     ):
         """
         Test updating a skill that belongs to another user.
         """
         # Arrange: Add skill to another user
         another_profile = another_verified_user_with_profile["profile"]
+        existing_id, _ = sample_skill_ids[0]
         profile_skill = ProfileSkill(
             profile_id=another_profile.id,
-            skill_id=sample_skills[0].id,
+            skill_id=existing_id,
             description="Another user's skill",
         )
         db_session.add(profile_skill)
-        await db_session.commit()
-
-        # Login as verified_user (not the owner)
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
+        await db_session.flush()
 
         # Act: Try to update another user's skill
         update_data = {"description": "Trying to steal this skill"}
@@ -1417,67 +1297,32 @@ class TestUpdateSkill:
         response = await async_client.patch(
             self.get_update_skill_url(str(profile_skill.id)),
             json=update_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 404  # Skill not found in current user's profile
-        response_data = response.json()
-        print(response_data)
-
-    async def test_update_skill_unauthenticated(
-        self,
-        async_client: AsyncClient,
-    ):
-        """
-        Test updating skill without authentication.
-        """
-        # Act
-        import uuid
-
-        fake_skill_id = str(uuid.uuid4())
-        update_data = {"description": "Should fail"}
-
-        response = await async_client.patch(
-            self.get_update_skill_url(fake_skill_id),
-            json=update_data,
-        )
-
-        # Assert
-        assert response.status_code == 401
-        response_data = response.json()
-        print(response_data)
-        assert response_data["err_code"] == "unauthorized"
+        assert response.json()["err_code"] == "not_found"
 
     async def test_update_skill_invalid_skill_id(
         self,
         async_client: AsyncClient,
-        verified_user: User,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test updating skill with invalid UUID format.
         """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Act: Use invalid UUID
         update_data = {"description": "Should fail"}
 
         response = await async_client.patch(
             self.get_update_skill_url("invalid-uuid"),
             json=update_data,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert: Should fail validation
-        print(response.json())
+        assert response.status_code == 422
 
 
 class TestDeleteSkill:
@@ -1486,31 +1331,17 @@ class TestDeleteSkill:
     def get_delete_skill_url(self, skill_id: str):
         return f"/api/v1/profiles/me/skills/{skill_id}"
 
-    login_url = "/api/v1/auth/token"
-
     async def test_delete_skill_success(
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
         profile_with_skills,
-        user3_data: dict,
+        auth_headers: dict,
     ):
         """
         Test successfully deleting a skill from profile.
         """
-        # Arrange: Login
-        user = profile_with_skills["user"]
-        login_data = {
-            "email": user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
         # Get one of the user's skills
-        from sqlmodel import select
-
         profile = profile_with_skills["profile"]
         statement = select(ProfileSkill).where(ProfileSkill.profile_id == profile.id)
         result = await db_session.exec(statement)
@@ -1519,114 +1350,115 @@ class TestDeleteSkill:
         # Act: Delete skill
         response = await async_client.delete(
             self.get_delete_skill_url(profile_skill.id),
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 204
 
         # Verify skill link is deleted
-        statement = select(ProfileSkill).where(ProfileSkill.id == profile_skill.id)
+        statement = select(exists().where(ProfileSkill.id == profile_skill.id))
         result = await db_session.exec(statement)
-        deleted_skill = result.first()
-        assert deleted_skill is None
-
-    async def test_delete_skill_not_found(
-        self,
-        async_client: AsyncClient,
-        verified_user: User,
-        user3_data: dict,
-    ):
-        """
-        Test deleting a skill that doesn't exist.
-        """
-        # Arrange: Login
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
-
-        # Act: Try to delete non-existent skill
-        import uuid
-
-        fake_skill_id = str(uuid.uuid4())
-
-        response = await async_client.delete(
-            self.get_delete_skill_url(fake_skill_id),
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-
-        # Assert
-        assert response.status_code == 404
-        response_data = response.json()
-        print(response_data)
-        assert response_data["err_code"] == "not_found"
+        assert not result.one()
 
     async def test_delete_skill_not_owned(
         self,
         async_client: AsyncClient,
         db_session: AsyncSession,
-        verified_user: User,
         another_verified_user_with_profile,
-        sample_skills,
-        user3_data: dict,
+        sample_skill_ids,
+        auth_headers: dict,
     ):
         """
         Test deleting a skill that belongs to another user.
         """
         # Arrange: Add skill to another user
         another_profile = another_verified_user_with_profile["profile"]
+        existing_id, _ = sample_skill_ids[0]
         profile_skill = ProfileSkill(
             profile_id=another_profile.id,
-            skill_id=sample_skills[0].id,
+            skill_id=existing_id,
             description="Another user's skill",
         )
         db_session.add(profile_skill)
-        await db_session.commit()
-
-        # Login as verified_user
-        login_data = {
-            "email": verified_user.email,
-            "password": user3_data["password"],
-        }
-        login_response = await async_client.post(self.login_url, json=login_data)
-        tokens = login_response.json()
-        access_token = tokens["access"]
+        await db_session.flush()
 
         # Act: Try to delete another user's skill
         response = await async_client.delete(
             self.get_delete_skill_url(str(profile_skill.id)),
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=auth_headers,
         )
 
         # Assert
         assert response.status_code == 404
-        response_data = response.json()
-        print(response_data)
+        assert response.json()["err_code"] == "not_found"
+
 
-    async def test_delete_skill_unauthenticated(
+class TestSkillEndpointErrors:
+    """Shared error cases for the /profiles/me/skills endpoints"""
+
+    skills_url = MY_SKILLS_URL
+
+    @pytest.mark.parametrize(
+        "method,with_skill_id,body",
+        [
+            ("POST", False, {"name": "Python", "description": "Should fail"}),
+            ("PATCH", True, {"description": "Should fail"}),
+            ("DELETE", True, None),
+        ],
+    )
+    async def test_skill_endpoint_unauthenticated(
         self,
         async_client: AsyncClient,
+        method: str,
+        with_skill_id: bool,
+        body: dict | None,
     ):
         """
-        Test deleting skill without authentication.
+        Test calling the skill endpoints without authentication.
         """
         # Act
-        import uuid
-
-        fake_skill_id = str(uuid.uuid4())
+        url = self.skills_url
+        if with_skill_id:
+            url = f"{url}/{MISSING_SKILL_ID}"
 
-        response = await async_client.delete(self.get_delete_skill_url(fake_skill_id))
+        response = await async_client.request(method, url, json=body)
 
         # Assert
         assert response.status_code == 401
         response_data = response.json()
-        print(response_data)
         assert response_data["err_code"] == "unauthorized"
 
+    @pytest.mark.parametrize(
+        "method,body",
+        [
+            ("PATCH", {"description": "This should fail"}),
+            ("DELETE", None),
+        ],
+    )
+    async def test_skill_endpoint_not_found(
+        self,
+        async_client: AsyncClient,
+        method: str,
+        body: dict | None,
+        auth_headers: dict,
+    ):
+        """
+        Test updating or deleting a skill that doesn't exist.
+        """
+        # Act: Target a non-existent skill
+        response = await async_client.request(
+            method,
+            f"{self.skills_url}/{MISSING_SKILL_ID}",
+            json=body,
+            headers=auth_headers,
+        )
+
+        # Assert
+        assert response.status_code == 404
+        response_data = response.json()
+        assert response_data["err_code"] == "not_found"
+
 
 # pytest src/tests/test_profiles.py::TestAddSkillToProfile -v -s
 # pytest src/tests/test_profiles.py::TestGetUserSkills -v -s
@@ -0,0 +1,40 @@
+import uuid
+from functools import lru_cache
+
+from src.auth.utils import create_access_token
+from src.db.models import User
+
+
+def fixture_user_id(username: str) -> uuid.UUID:
+    """
+    Returns a stable id for a fixture user, derived from their username.
+    """
+    return uuid.uuid5(uuid.NAMESPACE_URL, f"devsearch-tests:{username}")
+
+
+@lru_cache
+def _signed_access_token(username: str, user_id: str, role: str) -> str:
+    return create_access_token(
+        {
+            "username": username,
+            "user_id": user_id,
+            "role": role,
+        }
+    )
+
+
+def make_token(user: User) -> str:
+    """
+    Mints an access token for a user without going through the login endpoint.
+
+    The payload matches the one built by the login route, so the token is
+    accepted by get_current_user. Fixture users have stable ids, so each
+    identity is signed once and reused for the rest of the session; access
+    tokens last a day, far longer than a test run.
+    """
+    return _signed_access_token(user.username, str(user.id), user.role.value)
+
+
+def auth_header(user: User) -> dict:
+    """Returns a bearer Authorization header for the user."""
+    return {"Authorization": f"Bearer {make_token(user)}"}